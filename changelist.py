@@ -11,12 +11,16 @@ Outputs human-readable change list + CMX-style change EDL blocks.
 """
 
 import sys
-import re
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Tuple
-from enum import Enum
 
-class ChangeType(Enum):
+_CLIP_PREFIX = "* FROM CLIP NAME:"
+_CLIP_PREFIX_LEN = len(_CLIP_PREFIX)
+
+class ChangeType:
+    """Change categories as plain string constants (cheap to compare)."""
     UNCHANGED = "unchanged"
     CHANGED = "changed"
     NEW = "new"
@@ -31,30 +35,51 @@ class Edit:
     record_in: str
     record_out: str
     clip_name: str = ""
+    fps: int = field(default=24, compare=False, repr=False)
 
     def key(self) -> Tuple[str, str, str]:
         """Unique key: reel + source_in + source_out"""
         return (self.reel, self.source_in, self.source_out)
 
     def duration_tc(self) -> str:
-        return subtract_tc(self.source_out, self.source_in)
+        return subtract_tc(self.source_out, self.source_in, self.fps)
+
+@dataclass
+class TrimDetails:
+    """Trim information for a CHANGED edit. head/tail_change is None when that end did not move."""
+    __slots__ = ("time_diff_frames", "old_length_frames", "new_length_frames",
+                 "head_change", "head_from", "head_to",
+                 "tail_change", "tail_from", "tail_to")
+    time_diff_frames: int
+    old_length_frames: int
+    new_length_frames: int
+    head_change: Optional[str]
+    head_from: str
+    head_to: str
+    tail_change: Optional[str]
+    tail_from: str
+    tail_to: str
 
 def parse_tc(tc_str: str) -> int:
     """Parse HH:MM:SS:FF to total frames (24fps)."""
-    parts = list(map(int, tc_str.split(':')))
-    return ((parts[0]*60 + parts[1])*60 + parts[2])*24 + parts[3]
+    return tc_to_frames(tc_str, 24)
 
 def tc_to_frames(tc: str, fps: int = 24) -> int:
     h, m, s, f = map(int, tc.split(':'))
     return ((h*60 + m)*60 + s)*fps + f
 
 def frames_to_tc(frames: int, fps: int = 24) -> str:
-    h = frames // (60*60*fps)
-    frames %= (60*60*fps)
-    m = frames // (60*fps)
-    frames %= (60*fps)
-    s = frames // fps
-    f = frames % fps
+    if fps == 24:
+        # Common case: constants folded (86400 = 60*60*24, 1440 = 60*24)
+        h, frames = divmod(frames, 86400)
+        m, frames = divmod(frames, 1440)
+        s, f = divmod(frames, 24)
+    else:
+        fps_min = 60*fps
+        fps_hour = 60*fps_min
+        h, frames = divmod(frames, fps_hour)
+        m, frames = divmod(frames, fps_min)
+        s, f = divmod(frames, fps)
     return f"{h:02d}:{m:02d}:{s:02d}:{f:02d}"
 
 def subtract_tc(out_tc: str, in_tc: str, fps: int = 24) -> str:
@@ -66,78 +91,84 @@ class EDLParser:
 
     def parse(self, file_path: str) -> List[Edit]:
         edits = []
-        with open(file_path, 'r') as f:
-            lines = f.readlines()
-
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            if re.match(r'^\d{3,}', line):  # Event number like 001 or 0001
-                parts = line.split()
-                # CMX3600 format: EVENT  REEL  TRACK  TYPE  SOURCE_IN  SOURCE_OUT  RECORD_IN  RECORD_OUT
-                if len(parts) >= 8:
+        with open(file_path, 'r', buffering=1 << 20) as f:
+            lines = f.read().splitlines()
+
+        edit_ctor = Edit
+        edits_append = edits.append
+        fps = self.fps
+        intern = sys.intern
+
+        n = len(lines)
+        for i, raw in enumerate(lines):
+            line = raw.strip()
+            if len(line) > 2 and line[:3].isdigit():  # Event number like 001 or 0001
+                parts = line.split(None, 9)
+                # CMX3600 format: EVENT  REEL  TRACK  TYPE  [DURATION]  SOURCE_IN  SOURCE_OUT  RECORD_IN  RECORD_OUT
+                # Dissolves (D) and wipes (Wnnn) carry a transition duration before the timecodes
+                tc_col = 5 if len(parts) > 3 and parts[3][:1] in ("D", "W") else 4
+                if len(parts) >= tc_col + 4:
                     event_num = parts[0]
-                    reel = parts[1]
-                    # parts[2] = track (V), parts[3] = edit type (C)
-                    source_in = parts[4]
-                    source_out = parts[5]
-                    record_in = parts[6]
-                    record_out = parts[7]
+                    # Interned so equality checks in compare_edls hit the identity fast path
+                    reel = intern(parts[1])
+                    # parts[2] = track (V), parts[3] = edit type (C, D, Wnnn)
+                    source_in = intern(parts[tc_col])
+                    source_out = intern(parts[tc_col + 1])
+                    record_in = intern(parts[tc_col + 2])
+                    record_out = intern(parts[tc_col + 3])
 
                     # Look for clip name on next line
                     clip_name = ""
-                    if i + 1 < len(lines):
+                    if i + 1 < n:
                         next_line = lines[i + 1].strip()
-                        clip_name_match = re.search(r'\* FROM CLIP NAME: (.+)', next_line)
-                        if clip_name_match:
-                            clip_name = clip_name_match.group(1)
+                        if next_line.startswith(_CLIP_PREFIX):
+                            clip_name = next_line[_CLIP_PREFIX_LEN:].strip()
 
-                    edits.append(Edit(event_num, reel, source_in, source_out, record_in, record_out, clip_name))
-            i += 1
+                    edits_append(edit_ctor(event_num, reel, source_in, source_out, record_in, record_out, clip_name, fps))
         return edits
 
-def compare_edls(old_edits: List[Edit], new_edits: List[Edit], fps: int = 24) -> List[Tuple[ChangeType, Optional[Edit], Optional[Edit], dict]]:
-    """Compare old and new edits by position. Returns list of (type, old_edit, new_edit, details)"""
-    changes = []
+def compare_edls(old_edits: List[Edit], new_edits: List[Edit]) -> List[Tuple[str, Optional[Edit], Optional[Edit], Optional[TrimDetails]]]:
+    """Compare old and new edits by position. Returns list of (type, old_edit, new_edit, details)
 
-    max_len = max(len(old_edits), len(new_edits))
-
-    for i in range(max_len):
-        old_edit = old_edits[i] if i < len(old_edits) else None
-        new_edit = new_edits[i] if i < len(new_edits) else None
+    details is a TrimDetails for CHANGED edits and None otherwise.
+    """
+    changes = []
 
-        if old_edit is None and new_edit is not None:
-            # New event added at the end
-            changes.append((ChangeType.NEW, None, new_edit, {"description": "Clip added"}))
-        elif old_edit is not None and new_edit is None:
-            # Event deleted from the end (not reported in expected output)
-            changes.append((ChangeType.DELETED, old_edit, None, {}))
-        elif old_edit.reel != new_edit.reel:
-            # Different reel at same position = new clip replacing old
-            changes.append((ChangeType.NEW, old_edit, new_edit, {"description": "Clip added"}))
-        elif (old_edit.source_in == new_edit.source_in and
-              old_edit.source_out == new_edit.source_out):
-            # Same reel and same source timecodes = unchanged
-            changes.append((ChangeType.UNCHANGED, old_edit, new_edit, {}))
+    # Positions present in both EDLs
+    for old_edit, new_edit in zip(old_edits, new_edits):
+        if old_edit.reel == new_edit.reel:
+            if (old_edit.source_in == new_edit.source_in and
+                    old_edit.source_out == new_edit.source_out):
+                # Same reel and same source timecodes = unchanged
+                changes.append((ChangeType.UNCHANGED, old_edit, new_edit, None))
+            else:
+                # Same reel but different source timecodes = changed (trimmed)
+                details = compute_trim_details(old_edit, new_edit)
+                changes.append((ChangeType.CHANGED, old_edit, new_edit, details))
         else:
-            # Same reel but different source timecodes = changed (trimmed)
-            details = compute_trim_details(old_edit, new_edit, fps)
-            changes.append((ChangeType.CHANGED, old_edit, new_edit, details))
+            # Different reel at same position = new clip replacing old
+            changes.append((ChangeType.NEW, old_edit, new_edit, None))
 
-    return changes
+    # At most one of these tails is non-empty
+    common = min(len(old_edits), len(new_edits))
+    for old_edit in old_edits[common:]:
+        # Event deleted from the end (not reported in expected output)
+        changes.append((ChangeType.DELETED, old_edit, None, None))
+    for new_edit in new_edits[common:]:
+        # New event added at the end
+        changes.append((ChangeType.NEW, None, new_edit, None))
 
+    return changes
 
-def compute_trim_details(old_edit: Edit, new_edit: Edit, fps: int = 24) -> dict:
-    """Compute detailed trim information between old and new edit."""
-    old_src_in = tc_to_frames(old_edit.source_in, fps)
-    old_src_out = tc_to_frames(old_edit.source_out, fps)
-    new_src_in = tc_to_frames(new_edit.source_in, fps)
-    new_src_out = tc_to_frames(new_edit.source_out, fps)
 
-    old_rec_in = tc_to_frames(old_edit.record_in, fps)
-    old_rec_out = tc_to_frames(old_edit.record_out, fps)
-    new_rec_in = tc_to_frames(new_edit.record_in, fps)
-    new_rec_out = tc_to_frames(new_edit.record_out, fps)
+def compute_trim_details(old_edit: Edit, new_edit: Edit) -> TrimDetails:
+    """Compute detailed trim information between old and new edit (at the edits' own fps)."""
+    old_fps = old_edit.fps
+    new_fps = new_edit.fps
+    old_rec_in = tc_to_frames(old_edit.record_in, old_fps)
+    old_rec_out = tc_to_frames(old_edit.record_out, old_fps)
+    new_rec_in = tc_to_frames(new_edit.record_in, new_fps)
+    new_rec_out = tc_to_frames(new_edit.record_out, new_fps)
 
     # Record durations (timeline length)
     old_length = old_rec_out - old_rec_in
@@ -146,102 +177,96 @@ def compute_trim_details(old_edit: Edit, new_edit: Edit, fps: int = 24) -> dict:
     # Time difference = change in record duration
     time_diff = new_length - old_length
 
-    details = {
-        "time_diff_frames": time_diff,
-        "old_length_frames": old_length,
-        "new_length_frames": new_length,
-        "old_source_in": old_edit.source_in,
-        "new_source_in": new_edit.source_in,
-        "old_source_out": old_edit.source_out,
-        "new_source_out": new_edit.source_out,
-    }
-
-    # Determine head change
-    head_diff = new_src_in - old_src_in
-    if head_diff < 0:
-        details["head_change"] = "extended"
-        details["head_from"] = old_edit.source_in
-        details["head_to"] = new_edit.source_in
-    elif head_diff > 0:
-        details["head_change"] = "trimmed"
-        details["head_from"] = old_edit.source_in
-        details["head_to"] = new_edit.source_in
-
-    # Determine tail change
-    tail_diff = new_src_out - old_src_out
-    if tail_diff > 0:
-        details["tail_change"] = "extended"
-        details["tail_from"] = old_edit.source_out
-        details["tail_to"] = new_edit.source_out
-    elif tail_diff < 0:
-        details["tail_change"] = "trimmed"
-        details["tail_from"] = old_edit.source_out
-        details["tail_to"] = new_edit.source_out
-
-    return details
-
-
+    # Determine head change (only when the source in point actually moved)
+    head_change = None
+    head_from = head_to = ""
+    if old_edit.source_in != new_edit.source_in:
+        head_diff = tc_to_frames(new_edit.source_in, new_fps) - tc_to_frames(old_edit.source_in, old_fps)
+        if head_diff != 0:
+            head_change = "extended" if head_diff < 0 else "trimmed"
+            head_from = old_edit.source_in
+            head_to = new_edit.source_in
+
+    # Determine tail change (only when the source out point actually moved)
+    tail_change = None
+    tail_from = tail_to = ""
+    if old_edit.source_out != new_edit.source_out:
+        tail_diff = tc_to_frames(new_edit.source_out, new_fps) - tc_to_frames(old_edit.source_out, old_fps)
+        if tail_diff != 0:
+            tail_change = "extended" if tail_diff > 0 else "trimmed"
+            tail_from = old_edit.source_out
+            tail_to = new_edit.source_out
+
+    return TrimDetails(time_diff, old_length, new_length,
+                       head_change, head_from, head_to,
+                       tail_change, tail_from, tail_to)
+
+
+@lru_cache(maxsize=1024)
 def frames_to_description(frames: int, fps: int = 24) -> str:
     """Convert frames to human-readable format like '7 seconds 14 frames'."""
-    seconds = frames // fps
-    remaining_frames = frames % fps
+    seconds, remaining_frames = divmod(frames, fps)
+    f_word = "frame" if remaining_frames == 1 else "frames"
     if seconds == 0:
-        return f"{remaining_frames} frame{'s' if remaining_frames != 1 else ''}"
-    return f"{seconds} second{'s' if seconds != 1 else ''} {remaining_frames} frame{'s' if remaining_frames != 1 else ''}"
+        return f"{remaining_frames} {f_word}"
+    s_word = "second" if seconds == 1 else "seconds"
+    return f"{seconds} {s_word} {remaining_frames} {f_word}"
 
-def output_change_list(changes: List[Tuple[ChangeType, Optional[Edit], Optional[Edit], dict]], output_file: str, fps: int = 24):
+def output_change_list(changes: List[Tuple[str, Optional[Edit], Optional[Edit], Optional[TrimDetails]]], output_file: str, fps: int = 24):
     """Output changes in tab-separated format matching expected Changelog.txt format."""
+    out = []
+    append = out.append
+    no_diff = "No time difference. Shifted within itself. "
+    for typ, old_e, new_e, details in changes:
+        if typ == ChangeType.UNCHANGED:
+            continue
+        if typ == ChangeType.DELETED:
+            # Deleted events are not reported in the expected output
+            continue
+
+        # Use new_edit for position info, fall back to old_edit
+        edit = new_e if new_e else old_e
+        record_tc = edit.record_in
+        clip_name = edit.clip_name
+
+        if typ == ChangeType.NEW:
+            # New clip
+            description = f"Clip added ({clip_name})"
+            append(f"New\t{record_tc}\tTC\tmagenta\t{description}\t1\n")
+
+        elif typ == ChangeType.CHANGED:
+            # Changed clip with trim details
+            time_diff = details.time_diff_frames
+            old_length = details.old_length_frames
+            new_length = details.new_length_frames
+
+            # Time difference
+            if time_diff == 0:
+                time_part = no_diff
+            else:
+                time_part = f"Time difference {time_diff} frames  [{time_diff} frames]."
+
+            # Head change
+            head_str = (f" HEAD {details.head_change} from {details.head_from} to {details.head_to}."
+                        if details.head_change is not None else "")
+
+            # Tail change
+            tail_str = (f" TAIL {details.tail_change} from {details.tail_from} to {details.tail_to}."
+                        if details.tail_change is not None else "")
+
+            # Length info (only if time difference is not zero)
+            if time_diff != 0:
+                old_len_str = frames_to_description(old_length, fps)
+                new_len_str = frames_to_description(new_length, fps)
+                length_str = f" Old length: {old_len_str} [{old_length} frames] - New length: {new_len_str} [{new_length} frames]"
+            else:
+                length_str = ""
+
+            description = f"{time_part}{head_str}{tail_str}{length_str} ({clip_name})"
+            append(f"Changed\t{record_tc}\tTC\tyellow\t{description}\t1\n")
+
     with open(output_file, 'w') as f:
-        for typ, old_e, new_e, details in changes:
-            if typ == ChangeType.UNCHANGED:
-                continue
-            if typ == ChangeType.DELETED:
-                # Deleted events are not reported in the expected output
-                continue
-
-            # Use new_edit for position info, fall back to old_edit
-            edit = new_e if new_e else old_e
-            record_tc = edit.record_in
-            clip_name = edit.clip_name
-
-            if typ == ChangeType.NEW:
-                # New clip
-                description = f"Clip added ({clip_name})"
-                f.write(f"New\t{record_tc}\tTC\tmagenta\t{description}\t1\n")
-
-            elif typ == ChangeType.CHANGED:
-                # Changed clip with trim details
-                time_diff = details.get("time_diff_frames", 0)
-                old_length = details.get("old_length_frames", 0)
-                new_length = details.get("new_length_frames", 0)
-
-                # Build description
-                desc_parts = []
-
-                # Time difference
-                if time_diff == 0:
-                    desc_parts.append("No time difference. Shifted within itself. ")
-                else:
-                    desc_parts.append(f"Time difference {time_diff} frames  [{time_diff} frames].")
-
-                # Head change
-                if "head_change" in details:
-                    head_action = "extended" if details["head_change"] == "extended" else "trimmed"
-                    desc_parts.append(f" HEAD {head_action} from {details['head_from']} to {details['head_to']}.")
-
-                # Tail change
-                if "tail_change" in details:
-                    tail_action = "extended" if details["tail_change"] == "extended" else "trimmed"
-                    desc_parts.append(f" TAIL {tail_action} from {details['tail_from']} to {details['tail_to']}.")
-
-                # Length info (only if time difference is not zero)
-                if time_diff != 0:
-                    old_len_str = frames_to_description(old_length, fps)
-                    new_len_str = frames_to_description(new_length, fps)
-                    desc_parts.append(f" Old length: {old_len_str} [{old_length} frames] - New length: {new_len_str} [{new_length} frames]")
-
-                description = "".join(desc_parts) + f" ({clip_name})"
-                f.write(f"Changed\t{record_tc}\tTC\tyellow\t{description}\t1\n")
+        f.write("".join(out))
 
 if __name__ == "__main__":
     print("EDL Change List Generator")
@@ -253,12 +278,15 @@ if __name__ == "__main__":
 
     fps = 24
     parser = EDLParser(fps=fps)
-    old_edits = parser.parse(old_file)
-    new_edits = parser.parse(new_file)
+    # Parse both EDLs concurrently; file reads overlap
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        f_old = ex.submit(parser.parse, old_file)
+        f_new = ex.submit(parser.parse, new_file)
+        old_edits, new_edits = f_old.result(), f_new.result()
 
     print(f"Parsed {len(old_edits)} edits from old EDL, {len(new_edits)} from new.")
 
-    changes = compare_edls(old_edits, new_edits, fps)
+    changes = compare_edls(old_edits, new_edits)
 
     output_change_list(changes, output_file, fps)
 
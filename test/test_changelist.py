@@ -0,0 +1,112 @@
+"""
+Regression tests for the EDL change list generator.
+
+Run from the repository root:
+  python -m unittest discover -s test
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(TEST_DIR)
+sys.path.insert(0, REPO_DIR)
+
+from changelist import (ChangeType, EDLParser, TrimDetails, compare_edls,  # noqa: E402
+                        output_change_list, tc_to_frames)
+
+
+def run_changelist(old_file: str, new_file: str) -> str:
+    """Parse, compare and render two EDLs, returning the change list text."""
+    parser = EDLParser(fps=24)
+    old_edits = parser.parse(os.path.join(TEST_DIR, old_file))
+    new_edits = parser.parse(os.path.join(TEST_DIR, new_file))
+    changes = compare_edls(old_edits, new_edits)
+    with tempfile.TemporaryDirectory() as tmp:
+        out_path = os.path.join(tmp, "output.txt")
+        output_change_list(changes, out_path, 24)
+        with open(out_path) as f:
+            return f.read()
+
+
+def read_golden(path: str) -> str:
+    with open(path) as f:
+        return f.read()
+
+
+class GoldenOutputTest(unittest.TestCase):
+    """Change lists for the demo EDLs must match the outputs of the original implementation."""
+
+    def test_demo_v1_to_v2(self):
+        # Trailing event deleted: not reported in the change list
+        self.assertEqual(run_changelist("Demo_edit_v1.edl", "Demo_edit_v2.edl"),
+                         read_golden(os.path.join(REPO_DIR, "output.txt")))
+
+    def test_demo_v2_to_v1(self):
+        # Trailing event added: reported as a new clip
+        self.assertEqual(run_changelist("Demo_edit_v2.edl", "Demo_edit_v1.edl"),
+                         read_golden(os.path.join(TEST_DIR, "Demo_changelist_v2_v1.txt")))
+
+    def test_change_types(self):
+        parser = EDLParser(fps=24)
+        v1 = parser.parse(os.path.join(TEST_DIR, "Demo_edit_v1.edl"))
+        v2 = parser.parse(os.path.join(TEST_DIR, "Demo_edit_v2.edl"))
+        expected = [ChangeType.UNCHANGED, ChangeType.CHANGED, ChangeType.CHANGED,
+                    ChangeType.UNCHANGED, ChangeType.UNCHANGED, ChangeType.UNCHANGED,
+                    ChangeType.NEW, ChangeType.UNCHANGED, ChangeType.CHANGED,
+                    ChangeType.UNCHANGED, ChangeType.CHANGED]
+
+        forward = compare_edls(v1, v2)
+        self.assertEqual([c[0] for c in forward], expected + [ChangeType.DELETED])
+        self.assertIs(forward[-1][1], v1[-1])
+        self.assertIsNone(forward[-1][2])
+
+        reverse = compare_edls(v2, v1)
+        self.assertEqual([c[0] for c in reverse], expected + [ChangeType.NEW])
+        self.assertIsNone(reverse[-1][1])
+        self.assertIs(reverse[-1][2], v1[-1])
+
+        for typ, _, _, details in forward + reverse:
+            if typ == ChangeType.CHANGED:
+                self.assertIsInstance(details, TrimDetails)
+            else:
+                self.assertIsNone(details)
+
+
+class TimecodeTest(unittest.TestCase):
+    def test_tc_to_frames(self):
+        self.assertEqual(tc_to_frames("01:00:00:05"), 86405)
+        self.assertEqual(tc_to_frames("01:00:00:05", 25), 90005)
+        self.assertEqual(tc_to_frames("1:0:0:5"), 86405)
+
+    def test_tc_to_frames_rejects_bad_separators(self):
+        for tc in ("01x00y00z05", "01:00:00;00"):
+            with self.assertRaises(ValueError):
+                tc_to_frames(tc)
+
+
+class DissolveTest(unittest.TestCase):
+    def test_transition_duration_is_skipped(self):
+        edits = EDLParser(fps=24).parse(os.path.join(TEST_DIR, "Dissolve_edit_v1.edl"))
+        dissolve = edits[2]
+        self.assertEqual(dissolve.reel, "B002C004_220611_ABCD")
+        self.assertEqual(dissolve.source_in, "20:00:00:00")
+        self.assertEqual(dissolve.source_out, "20:00:04:00")
+        self.assertEqual(dissolve.record_in, "01:00:05:00")
+        self.assertEqual(dissolve.record_out, "01:00:09:00")
+        self.assertEqual(dissolve.clip_name, "B002C004_220611_ABCD.mov")
+
+    def test_changed_dissolve(self):
+        expected = (
+            "Changed\t01:00:05:00\tTC\tyellow\tTime difference 6 frames  [6 frames]."
+            " TAIL extended from 20:00:04:00 to 20:00:04:06."
+            " Old length: 4 seconds 0 frames [96 frames] - New length: 4 seconds 6 frames [102 frames]"
+            " (B002C004_220611_ABCD.mov)\t1\n"
+        )
+        self.assertEqual(run_changelist("Dissolve_edit_v1.edl", "Dissolve_edit_v2.edl"), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()